@@ -0,0 +1,80 @@
+"""Сравнение удаления дубликатов результатов подзадач: попарное сравнение (sort + equals) и поиск по отпечатку.
+
+Запуск:
+    python benchmarks/bench_dedup.py --frames 200 --rows 100000 --unique 0.5
+"""
+
+import argparse
+import time
+
+import numpy as np
+import polars as pl
+
+from telemars.tasks.general import frame_fingerprint
+
+
+def dedup_pairwise(dfs: list[pl.DataFrame]) -> list[pl.DataFrame]:
+    """Прежний алгоритм: каждый DataFrame сортируется и сравнивается со всеми оставленными ранее."""
+    udfs: list[pl.DataFrame] = []
+    result: list[pl.DataFrame] = []
+
+    for df in dfs:
+        if not any(df.sort(by=df.columns).equals(edf) for edf in udfs):
+            udfs.append(df.sort(by=df.columns))
+            result.append(df)
+
+    return result
+
+
+def dedup_fingerprint(dfs: list[pl.DataFrame]) -> list[pl.DataFrame]:
+    """Новый алгоритм: каждый DataFrame хэшируется один раз, дубликаты ищутся в словаре."""
+    fingerprints: set[str] = set()
+    result: list[pl.DataFrame] = []
+
+    for df in dfs:
+        fingerprint: str = frame_fingerprint(df)
+
+        if fingerprint not in fingerprints:
+            fingerprints.add(fingerprint)
+            result.append(df)
+
+    return result
+
+
+def make_frames(frames: int, rows: int, unique: float, seed: int = 0) -> list[pl.DataFrame]:
+    """Формирует DataFrame со срезами researchDate, adSpotId и одной статистикой. Дубликаты перемешаны по строкам."""
+    rng: np.random.Generator = np.random.default_rng(seed)
+    n_unique: int = max(1, int(frames * unique))
+
+    base: list[pl.DataFrame] = [
+        pl.DataFrame(
+            {
+                'researchDate': rng.choice(['2025-05-{:02d}'.format(d) for d in range(1, 32)], rows),
+                'adSpotId': rng.integers(6_000_000_000, 7_000_000_000, rows).astype(str),
+                'RtgPer': rng.random(rows),
+            }
+        )
+        for _ in range(n_unique)
+    ]
+
+    return [base[i % n_unique].sample(fraction=1.0, shuffle=True, seed=i) for i in range(frames)]
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--frames', type=int, default=200, help='Количество DataFrame.')
+    parser.add_argument('--rows', type=int, default=100_000, help='Количество строк в DataFrame.')
+    parser.add_argument('--unique', type=float, default=0.5, help='Доля уникальных DataFrame.')
+    args: argparse.Namespace = parser.parse_args()
+
+    dfs: list[pl.DataFrame] = make_frames(args.frames, args.rows, args.unique)
+    print('DataFrame: {}, строк: {}, уникальных: {:.0%}'.format(args.frames, args.rows, args.unique))
+
+    for name, func in (('sort + equals', dedup_pairwise), ('fingerprint', dedup_fingerprint)):
+        started: float = time.perf_counter()
+        kept: int = len(func(dfs))
+        print('{:>15}: {:8.2f} с, оставлено {}'.format(name, time.perf_counter() - started, kept))
+
+
+if __name__ == '__main__':
+    main()
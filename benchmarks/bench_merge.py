@@ -0,0 +1,63 @@
+"""Сравнение объединения результатов подзадач региона: последовательные left join по срезам и merge_frames.
+
+Запуск:
+    python benchmarks/bench_merge.py --frames 30 --rows 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import polars as pl
+
+from telemars.tasks.general import merge_frames
+
+SLICES: list[str] = ['researchDate', 'adSpotId']
+
+
+def merge_joins(dfs: list[pl.DataFrame]) -> pl.DataFrame:
+    """Прежний алгоритм: последовательные left join по срезам."""
+    df: pl.DataFrame = dfs[0]
+
+    for rdf in dfs[1:]:
+        df = df.join(rdf, on=SLICES, how='left')
+
+    return df
+
+
+def make_frames(frames: int, rows: int, seed: int = 0) -> list[pl.DataFrame]:
+    """Формирует DataFrame с одинаковыми срезами в разном порядке строк и отдельной статистикой в каждом."""
+    rng: np.random.Generator = np.random.default_rng(seed)
+    keys: pl.DataFrame = pl.DataFrame(
+        {
+            'researchDate': rng.choice(['2025-05-{:02d}'.format(d) for d in range(1, 32)], rows),
+            'adSpotId': np.arange(6_000_000_000, 6_000_000_000 + rows).astype(str),
+        }
+    )
+
+    return [
+        keys.sample(fraction=1.0, shuffle=True, seed=i).with_columns(pl.Series('RtgPer {}'.format(i), rng.random(rows)))
+        for i in range(frames)
+    ]
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--frames', type=int, default=30, help='Количество DataFrame (статистик).')
+    parser.add_argument('--rows', type=int, default=100_000, help='Количество строк в DataFrame.')
+    args: argparse.Namespace = parser.parse_args()
+
+    dfs: list[pl.DataFrame] = make_frames(args.frames, args.rows)
+    print('DataFrame: {}, строк: {}'.format(args.frames, args.rows))
+
+    for name, func in (
+        ('left join', merge_joins),
+        ('hashed key', lambda dfs: merge_frames(dfs, SLICES, how='left')),
+    ):
+        started: float = time.perf_counter()
+        shape: tuple[int, int] = func(dfs).shape
+        print('{:>12}: {:8.2f} с, {}'.format(name, time.perf_counter() - started, shape))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import weakref
+from types import TracebackType
+
+from mediascope_api.core import net as mscore
+from mediascope_api.mediavortex import catalogs as cwc
+from mediascope_api.mediavortex import tasks as cwt
+from typing_extensions import Any, Optional, Self
+
+from telemars.api.transport import AsyncTransport
+
+
+class TelemarsClient:
+    """Сессия работы с Mediascope API, общая для множества задач.
+
+    Владеет одним сетевым модулем mediascope-api-lib (настройки и токен), одним экземпляром MediaVortexTask и
+    справочниками, а также пулом асинхронных соединений. Компоненты создаются при первом обращении.
+
+    Пример:
+        async with TelemarsClient() as client:
+            df = await SimpleTask(..., client=client).execute()
+
+    Компоненты mediascope-api-lib создаются под блокировкой и могут использоваться из нескольких потоков.
+    Пул соединений привязан к циклу событий, поэтому для каждого цикла событий создается отдельный транспорт.
+    """
+
+    def __init__(
+        self,
+        settings_filename: Optional[str] = None,
+        username: Optional[str] = None,
+        passw: Optional[str] = None,
+        root_url: Optional[str] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        keycloak_url: Optional[str] = None,
+        **transport_kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            settings_filename (Optional[str]): Путь к settings.json. По умолчанию settings.json в текущей директории.
+            username, passw, root_url, client_id, client_secret, keycloak_url (Optional[str]): Настройки подключения.
+                Если заданы все, settings.json не читается.
+            **transport_kwargs: Параметры AsyncTransport: max_connections, timeout, retries и т.д.
+        """
+        self._settings: dict[str, Optional[str]] = {
+            'settings_filename': settings_filename,
+            'username': username,
+            'passw': passw,
+            'root_url': root_url,
+            'client_id': client_id,
+            'client_secret': client_secret,
+            'keycloak_url': keycloak_url,
+        }
+        self._transport_kwargs: dict[str, Any] = transport_kwargs
+
+        self._lock: threading.RLock = threading.RLock()
+        self._mnet: Optional[mscore.MediascopeApiNetwork] = None
+        self._mtask: Optional[cwt.MediaVortexTask] = None
+        self._transports: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncTransport] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def mnet(self) -> mscore.MediascopeApiNetwork:
+        """Сетевой модуль mediascope-api-lib. Настройки читаются один раз."""
+        with self._lock:
+            if self._mnet is None:
+                self._mnet = mscore.MediascopeApiNetwork(**self._settings)
+
+            return self._mnet
+
+    @property
+    def mtask(self) -> cwt.MediaVortexTask:
+        """Экземпляр MediaVortexTask, использующий общий сетевой модуль."""
+        with self._lock:
+            if self._mtask is None:
+                mtask: cwt.MediaVortexTask = cwt.MediaVortexTask(check_version=False, **self._settings)
+
+                # NOTE: MediaVortexTask и справочники создают собственные сетевые модули. Заменяем их общим, чтобы
+                # токен и соединения requests переиспользовались.
+                mtask.network_module = self.mnet
+                mtask.cats.msapi_network = self.mnet
+
+                self._mtask = mtask
+
+            return self._mtask
+
+    @property
+    def cats(self) -> cwc.MediaVortexCats:
+        """Справочники Mediascope. Используется экземпляр, созданный MediaVortexTask."""
+        return self.mtask.cats
+
+    @property
+    def transport(self) -> AsyncTransport:
+        """Асинхронный транспорт для текущего цикла событий."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        with self._lock:
+            transport: Optional[AsyncTransport] = self._transports.get(loop)
+
+            if transport is None:
+                transport = AsyncTransport.from_network(self.mnet, **self._transport_kwargs)
+                self._transports[loop] = transport
+
+            return transport
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Закрывает пул соединений текущего цикла событий."""
+        with self._lock:
+            transport: Optional[AsyncTransport] = self._transports.pop(asyncio.get_running_loop(), None)
+
+        if transport is not None:
+            await transport.aclose()
+
+
+_default_client: Optional[TelemarsClient] = None
+_default_client_lock: threading.Lock = threading.Lock()
+
+
+def get_default_client() -> TelemarsClient:
+    """Возвращает клиент процесса по умолчанию с настройками из settings.json.
+
+    Используется задачами, для которых клиент не задан явно.
+    """
+    global _default_client
+
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = TelemarsClient()
+
+        return _default_client
@@ -0,0 +1,124 @@
+import io
+
+import polars as pl
+from typing_extensions import Mapping, Optional, Sequence, Union
+
+# Срезы со временем в формате ЧЧММСС. Приводятся к формату ЧЧ:ММ:СС (аналогично result2table).
+TIME_SLICES: frozenset[str] = frozenset(
+    {
+        'programStartTime',
+        'programStartTimeOriginal',
+        'programFinishTime',
+        'programFinishTimeOriginal',
+        'breaksStartTime',
+        'breaksStartTimeOriginal',
+        'breaksFinishTime',
+        'breaksFinishTimeOriginal',
+        'adStartTime',
+        'adStartTimeOriginal',
+        'adFinishTime',
+        'adFinishTimeOriginal',
+    }
+)
+
+# Названия дней недели для среза researchWeekDay.
+WEEKDAY_NAMES: dict[str, str] = {
+    '1': 'Понедельник',
+    '2': 'Вторник',
+    '3': 'Среда',
+    '4': 'Четверг',
+    '5': 'Пятница',
+    '6': 'Суббота',
+    '7': 'Воскресенье',
+}
+
+# Значение среза, отсутствующего в строке результата (аналогично result2table).
+MISSING_SLICE: str = '-'
+
+
+def decode_result(
+    result: Union[bytes, dict],
+    slices: Sequence[str],
+    statistics: Sequence[str],
+    value_names: Optional[Mapping[str, Mapping[str, str]]] = None,
+) -> pl.DataFrame:
+    """Преобразует результат задания Mediascope в pl.DataFrame без промежуточного pandas.DataFrame.
+
+    Сохраняются только запрошенные срезы и статистики. Значения срезов приводятся к строкам, время и дни недели
+    форматируются так же, как в result2table из mediascope-api-lib.
+
+    Args:
+        result (Union[bytes, dict]): Ответ сервера: тело ответа в формате JSON или уже разобранный словарь. Тело ответа
+            разбирается средствами Polars без создания объектов Python для каждой строки.
+        slices (Sequence[str]): Срезы.
+        statistics (Sequence[str]): Статистики.
+        value_names (Optional[Mapping[str, Mapping[str, str]]]): Названия значений демографических срезов:
+            срез -> (идентификатор значения -> название).
+
+    Returns:
+        pl.DataFrame: Срезы (pl.String) и статистики. Пустой DataFrame, если результат не содержит строк.
+    """
+    rows: pl.DataFrame = _decode_rows(result)
+
+    if rows.is_empty():
+        return pl.DataFrame()
+
+    columns: list[pl.Expr] = []
+
+    for name in slices:
+        col: pl.Expr = pl.col(name).cast(pl.String) if name in rows.columns else pl.lit(None, dtype=pl.String)
+        col = col.fill_null(MISSING_SLICE)
+
+        if value_names is not None and name in value_names:
+            col = col.replace_strict(dict(value_names[name]), default=None, return_dtype=pl.String)
+        elif name in TIME_SLICES:
+            # NOTE: В отличие от result2table, отсутствующее время не форматируется и остается MISSING_SLICE.
+            col = (
+                pl.when(col != MISSING_SLICE)
+                .then(
+                    pl.concat_str(
+                        col.str.slice(0, col.str.len_chars() - 4),
+                        col.str.slice(-4, 2),
+                        col.str.slice(-2),
+                        separator=':',
+                    )
+                )
+                .otherwise(col)
+            )
+        elif name == 'researchWeekDay':
+            col = col.replace_strict(WEEKDAY_NAMES, default=None, return_dtype=pl.String)
+
+        columns.append(col.alias(name))
+
+    for name in statistics:
+        columns.append(pl.col(name) if name in rows.columns else pl.lit(None).alias(name))
+
+    return rows.select(columns)
+
+
+def _decode_rows(result: Union[bytes, dict]) -> pl.DataFrame:
+    """Разворачивает resultBody в DataFrame, где каждому срезу и статистике соответствует отдельный столбец."""
+    if isinstance(result, dict):
+        body: list[dict] = result.get('resultBody') or []
+
+        if not body:
+            return pl.DataFrame()
+
+        return pl.DataFrame(
+            [{**item['slice'], **item['statistics']} for item in body], infer_schema_length=None, strict=False
+        )
+
+    # NOTE: Схема определяется по всем строкам, чтобы целые и дробные значения одной статистики не конфликтовали.
+    df: pl.DataFrame = pl.read_json(io.BytesIO(result), infer_schema_length=None)
+
+    if 'resultBody' not in df.columns or not isinstance(df.schema['resultBody'], pl.List):
+        return pl.DataFrame()
+
+    inner: pl.DataType = df.schema['resultBody'].inner
+
+    if not isinstance(inner, pl.Struct):
+        return pl.DataFrame()
+
+    rows: pl.DataFrame = df.select(pl.col('resultBody').explode()).unnest('resultBody')
+
+    return rows.unnest([c for c in ('slice', 'statistics') if c in rows.columns])
@@ -0,0 +1,253 @@
+import asyncio
+import json
+import time
+from types import TracebackType
+
+import httpx
+from mediascope_api.core import errors as mserr
+from mediascope_api.core import net as mscore
+from typing_extensions import Any, AsyncIterator, Optional, Self, Sequence
+
+# Состояния задания, при которых расчет еще не завершен.
+PENDING_STATES: frozenset[str] = frozenset({'IN_PROGRESS', 'PENDING', 'IN_QUEUE', 'IDLE'})
+
+# Коды ответа, при которых запрос повторяется (аналогично mediascope-api-lib).
+RETRY_STATUS_CODES: frozenset[int] = frozenset({502, 503, 504})
+
+# Запас времени (сек.) до истечения токена, при котором токен обновляется заранее.
+TOKEN_EXPIRY_MARGIN: float = 30.0
+
+
+class AsyncTransport:
+    """Асинхронный транспорт Mediascope API.
+
+    Отправляет задания, опрашивает их статус и получает результаты через общий пул соединений httpx с keep-alive.
+    Один экземпляр можно использовать одновременно из множества задач одного цикла событий.
+    """
+
+    def __init__(
+        self,
+        root_url: str,
+        keycloak_url: str,
+        username: str,
+        passw: str,
+        client_id: str,
+        client_secret: str,
+        max_connections: int = 32,
+        timeout: float = 60.0,
+        retries: int = 5,
+        backoff_factor: float = 1.0,
+        proxy: Optional[str] = None,
+        status_delay: float = 3.0,
+    ) -> None:
+        self.root_url: str = root_url.rstrip('/')
+        self.keycloak_url: str = keycloak_url
+        self.username: str = username
+        self.passw: str = passw
+        self.client_id: str = client_id
+        self.client_secret: str = client_secret
+        self.retries: int = retries
+        self.backoff_factor: float = backoff_factor
+        self.status_delay: float = status_delay
+
+        self._client: httpx.AsyncClient = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+            proxy=proxy or None,
+        )
+
+        self._token: Optional[str] = None
+        self._token_expires: float = 0.0
+        self._token_lock: asyncio.Lock = asyncio.Lock()
+
+    @classmethod
+    def from_network(cls, mnet: mscore.MediascopeApiNetwork, **kwargs: Any) -> Self:
+        """Создает транспорт с настройками подключения из MediascopeApiNetwork."""
+        proxy: Optional[str] = (mnet.proxies or {}).get('https') or None
+
+        return cls(
+            root_url=mnet.root_url,
+            keycloak_url=mnet.keycloak_url,
+            username=mnet.username,
+            passw=mnet.passw,
+            client_id=mnet.client_id,
+            client_secret=mnet.client_secret,
+            proxy=proxy,
+            **kwargs,
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Закрывает пул соединений."""
+        await self._client.aclose()
+
+    async def _get_token(self) -> str:
+        """Возвращает действующий токен доступа, при необходимости запрашивая новый."""
+        async with self._token_lock:
+            if self._token is not None and time.monotonic() < self._token_expires:
+                return self._token
+
+            response: httpx.Response = await self._client.post(
+                self.keycloak_url,
+                data={
+                    'client_id': self.client_id,
+                    'client_secret': self.client_secret,
+                    'username': self.username,
+                    'password': self.passw,
+                    'grant_type': 'password',
+                },
+            )
+
+            if response.status_code != 200:
+                _raise_error(response)
+
+            token: dict = response.json()
+            self._token = token['access_token']
+            self._token_expires = time.monotonic() + float(token.get('expires_in', 0)) - TOKEN_EXPIRY_MARGIN
+
+            return self._token
+
+    async def request(self, method: str, endpoint: str, data: Optional[str] = None) -> Any:
+        """Выполняет запрос к Mediascope API и возвращает ответ в формате JSON.
+
+        Args:
+            method (str): HTTP метод: get, post.
+            endpoint (str): Путь к точке API относительно root_url.
+            data (Optional[str]): Тело запроса в формате JSON.
+
+        Returns:
+            Any: Ответ сервера.
+        """
+        return json.loads(await self.request_raw(method, endpoint, data))
+
+    async def request_raw(self, method: str, endpoint: str, data: Optional[str] = None) -> bytes:
+        """Выполняет запрос к Mediascope API и возвращает тело ответа без разбора JSON."""
+        content: Optional[bytes] = data.encode('utf-8') if data is not None else None
+
+        for attempt in range(self.retries + 1):
+            token: str = await self._get_token()
+            response: httpx.Response = await self._client.request(
+                method.upper(),
+                self.root_url + endpoint,
+                content=content,
+                headers={
+                    'Authorization': 'Bearer {}'.format(token),
+                    'Content-Type': 'application/json; charset=utf-8',
+                },
+            )
+
+            if response.status_code == 200:
+                return response.content
+
+            # Токен мог быть отозван сервером раньше срока. Запрашиваем новый один раз.
+            if response.status_code == 401 and attempt == 0:
+                self._token = None
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.retries:
+                await asyncio.sleep(self.backoff_factor * 2**attempt)
+                continue
+
+            break
+
+        _raise_error(response)
+
+    async def submit(self, task_type: str, task_json: str) -> dict:
+        """Отправляет задание на расчет и возвращает ответ сервера с taskId."""
+        return await self.request('post', '/task/{}'.format(task_type), task_json)
+
+    async def get_state(self, task_id: str) -> dict:
+        """Возвращает состояние задания."""
+        return await self.request('get', '/task/state/{}'.format(task_id))
+
+    async def get_states(self, task_ids: Sequence[str]) -> list[dict]:
+        """Возвращает состояния нескольких заданий одним запросом."""
+        response: dict = await self.request('post', '/task/state', json.dumps({'taskIds': list(task_ids)}))
+
+        return response.get('data') or []
+
+    async def get_result(self, task_id: str) -> dict:
+        """Возвращает результат расчета задания."""
+        return await self.request('get', '/task/result/{}'.format(task_id))
+
+    async def get_result_raw(self, task_id: str) -> bytes:
+        """Возвращает результат расчета задания в формате JSON без разбора (см. telemars.api.decoder)."""
+        return await self.request_raw('get', '/task/result/{}'.format(task_id))
+
+    async def iter_completed(
+        self, task_ids: Sequence[str], status_delay: Optional[float] = None
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """Опрашивает состояние заданий одним запросом и возвращает задания по мере завершения расчета.
+
+        Args:
+            task_ids (Sequence[str]): Идентификаторы заданий.
+            status_delay (Optional[float]): Задержка в секундах между опросами статуса. По умолчанию status_delay
+                транспорта.
+
+        Yields:
+            tuple[str, dict]: Идентификатор задания и его итоговое состояние: DONE, FAILED, CANCELLED и т.д.
+        """
+        pending: list[str] = list(dict.fromkeys(task_ids))
+        delay: float = self.status_delay if status_delay is None else status_delay
+
+        while pending:
+            await asyncio.sleep(delay)
+
+            states: dict[str, dict] = {state['taskId']: state for state in await self.get_states(pending)}
+            still_pending: list[str] = []
+
+            for task_id in pending:
+                state: Optional[dict] = states.get(task_id)
+
+                # Задания без полученного состояния продолжаем ожидать.
+                if state is None or state.get('taskStatus') in PENDING_STATES:
+                    still_pending.append(task_id)
+                else:
+                    yield task_id, state
+
+            pending = still_pending
+
+    async def wait_tasks(self, task_ids: Sequence[str], status_delay: Optional[float] = None) -> dict[str, dict]:
+        """Ожидает окончания расчета заданий, опрашивая их состояние одним запросом.
+
+        Args:
+            task_ids (Sequence[str]): Идентификаторы заданий.
+            status_delay (Optional[float]): Задержка в секундах между опросами статуса. По умолчанию status_delay
+                транспорта.
+
+        Returns:
+            dict[str, dict]: Итоговые состояния заданий: DONE, FAILED, CANCELLED и т.д.
+        """
+        return {task_id: state async for task_id, state in self.iter_completed(task_ids, status_delay)}
+
+
+def _raise_error(response: httpx.Response) -> None:
+    """Поднимает исключение mediascope-api-lib, соответствующее коду ответа."""
+    status_code: int = response.status_code
+
+    if status_code == 204:
+        raise mserr.NoDataError('Сообщение: "{}"'.format(response.text), status_code)
+    elif status_code == 400:
+        raise mserr.BadRequestError('Не верный запрос: "{}"'.format(response.text), status_code)
+    elif status_code == 401:
+        raise mserr.AuthorizationError('Ошибка авторизации: "{}"'.format(response.text), status_code)
+    elif status_code == 403:
+        raise mserr.AccessForbiddenError('Доступ запрещен: "{}"'.format(response.text), status_code)
+    elif status_code == 404:
+        raise mserr.NotFoundError('Ресурс не найден: "{}"'.format(response.text), status_code)
+    elif status_code == 429:
+        raise mserr.TooManyRequestsError('Слишком много запросов: "{}"'.format(response.text), status_code)
+    elif status_code >= 500:
+        raise mserr.ServerError('Ошибка сервера: "{}"'.format(response.text), status_code)
+
+    raise mserr.MediascopeApiError('Ошибка: "{}"'.format(response.text), status_code)
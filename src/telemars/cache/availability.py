@@ -0,0 +1,110 @@
+import json
+import logging
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from mediascope_api.mediavortex import catalogs as cwc
+from typing_extensions import Optional, Union
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Время жизни доступных периодов по умолчанию.
+AVAILABILITY_TTL: timedelta = timedelta(hours=1)
+
+
+class AvailabilityCache:
+    """Кэш доступных периодов расчета по KitID с ограниченным временем жизни.
+
+    Один экземпляр используется всеми задачами процесса (см. availability_cache), поэтому справочник запрашивается
+    не чаще одного раза за время жизни, а не при создании каждой задачи. Если задан path, периоды дополнительно
+    сохраняются в JSON файл и переживают перезапуск процесса.
+    """
+
+    def __init__(self, ttl: timedelta = AVAILABILITY_TTL, path: Optional[Union[str, Path]] = None) -> None:
+        self.ttl: timedelta = ttl
+        self.path: Optional[Path] = Path(path) if path is not None else None
+
+        # KitID -> (начало периода, окончание периода).
+        self._periods: dict[int, tuple[date, date]] = {}
+        # Время получения периодов (Unix time). 0 - периоды не получены.
+        self._fetched_at: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at < self.ttl.total_seconds()
+
+    def _load(self) -> bool:
+        """Загружает периоды из файла, если файл существует и не устарел."""
+        if self.path is None or not self.path.exists():
+            return False
+
+        try:
+            data: dict = json.loads(self.path.read_text(encoding='utf-8'))
+            fetched_at: float = float(data['fetched_at'])
+            periods: dict[int, tuple[date, date]] = {
+                int(kit_id): (date.fromisoformat(period[0]), date.fromisoformat(period[1]))
+                for kit_id, period in data['periods'].items()
+            }
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning('Не удалось прочитать доступные периоды из %s: %s', self.path, e)
+            return False
+
+        if not self._is_fresh(fetched_at):
+            return False
+
+        self._periods, self._fetched_at = periods, fetched_at
+
+        return True
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+
+        data: dict = {
+            'fetched_at': self._fetched_at,
+            'periods': {str(k): [p[0].isoformat(), p[1].isoformat()] for k, p in self._periods.items()},
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp: Path = self.path.with_name(self.path.name + '.tmp')
+        tmp.write_text(json.dumps(data), encoding='utf-8')
+        tmp.replace(self.path)
+
+    def _fetch(self, cats: cwc.MediaVortexCats) -> None:
+        """Запрашивает доступные периоды из справочника Mediascope."""
+        periods: dict[int, tuple[date, date]] = {}
+
+        for kit_id, period_from, period_to in cats.get_availability_period()[
+            ['id', 'periodFrom', 'periodTo']
+        ].itertuples(index=False):
+            periods[int(kit_id)] = (date.fromisoformat(period_from), date.fromisoformat(period_to))
+
+        self._periods, self._fetched_at = periods, time.time()
+        self._save()
+
+    def get(self, cats: cwc.MediaVortexCats, kit_id: int) -> Optional[tuple[date, date]]:
+        """Возвращает доступный период (начало, окончание) для KitID или None, если KitID не найден.
+
+        Args:
+            cats (cwc.MediaVortexCats): Справочники Mediascope, используемые при устаревании кэша.
+            kit_id (int): Идентификатор KitID.
+        """
+        with self._lock:
+            if not self._is_fresh(self._fetched_at) and not self._load():
+                self._fetch(cats)
+
+            return self._periods.get(kit_id)
+
+    def clear(self) -> None:
+        """Сбрасывает кэш, в том числе файл на диске."""
+        with self._lock:
+            self._periods, self._fetched_at = {}, 0.0
+
+            if self.path is not None:
+                self.path.unlink(missing_ok=True)
+
+
+# Общий кэш доступных периодов для всех задач процесса.
+availability_cache: AvailabilityCache = AvailabilityCache()
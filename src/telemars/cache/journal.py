@@ -0,0 +1,101 @@
+import logging
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from typing_extensions import Iterable, Optional, Sequence, Union
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Максимальное количество параметров в одном запросе SQLite.
+SQLITE_MAX_PARAMS: int = 900
+
+
+class TaskJournal:
+    """Журнал отправленных подзадач в базе SQLite.
+
+    Для каждой подзадачи сохраняются отпечаток (см. telemars.utils.functools.task_fingerprint), идентификатор задания
+    на сервере и последнее известное состояние. После перезапуска процесса задача с тем же журналом подключается к уже
+    отправленным заданиям и загружает их результаты вместо повторной отправки. Записи старше max_age не используются:
+    сервер хранит результаты ограниченное время.
+
+    Журнал можно использовать одновременно из нескольких потоков и процессов.
+    """
+
+    def __init__(self, path: Union[str, Path], max_age: Optional[timedelta] = None) -> None:
+        self.path: Path = Path(path)
+        self.max_age: Optional[timedelta] = max_age
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS tasks ('
+            'fingerprint TEXT PRIMARY KEY, task_id TEXT NOT NULL, status TEXT NOT NULL, updated_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+    def lookup(self, fingerprints: Sequence[str]) -> dict[str, str]:
+        """Возвращает идентификаторы заданий на сервере для подзадач, записанных в журнал.
+
+        Args:
+            fingerprints (Sequence[str]): Отпечатки подзадач.
+
+        Returns:
+            dict[str, str]: Отпечаток подзадачи -> идентификатор задания. Подзадачи без записи или с устаревшей записью
+                не возвращаются.
+        """
+        min_updated_at: float = time.time() - self.max_age.total_seconds() if self.max_age is not None else 0.0
+        found: dict[str, str] = {}
+
+        with self._lock:
+            for i in range(0, len(fingerprints), SQLITE_MAX_PARAMS):
+                chunk: Sequence[str] = fingerprints[i : i + SQLITE_MAX_PARAMS]
+                rows: list[tuple[str, str]] = self._conn.execute(
+                    'SELECT fingerprint, task_id FROM tasks WHERE updated_at >= ? AND fingerprint IN ({})'.format(
+                        ', '.join('?' * len(chunk))
+                    ),
+                    (min_updated_at, *chunk),
+                ).fetchall()
+                found.update(rows)
+
+        return found
+
+    def record(self, entries: Iterable[tuple[str, str, str]]) -> None:
+        """Сохраняет состояние подзадач одной транзакцией.
+
+        Args:
+            entries (Iterable[tuple[str, str, str]]): Отпечаток подзадачи, идентификатор задания и его состояние.
+        """
+        now: float = time.time()
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT INTO tasks (fingerprint, task_id, status, updated_at) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(fingerprint) DO UPDATE SET '
+                'task_id = excluded.task_id, status = excluded.status, updated_at = excluded.updated_at',
+                [(fingerprint, task_id, status, now) for fingerprint, task_id, status in entries],
+            )
+
+    def status(self, fingerprint: str) -> Optional[str]:
+        """Возвращает последнее известное состояние подзадачи или None, если подзадача не записана в журнал."""
+        with self._lock:
+            row: Optional[tuple[str]] = self._conn.execute(
+                'SELECT status FROM tasks WHERE fingerprint = ?', (fingerprint,)
+            ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def clear(self) -> None:
+        """Удаляет все записи журнала."""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM tasks')
+
+    def close(self) -> None:
+        """Закрывает соединение с базой."""
+        with self._lock:
+            self._conn.close()
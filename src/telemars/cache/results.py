@@ -0,0 +1,116 @@
+import logging
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import polars as pl
+from typing_extensions import Optional, Union
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """Файловый кэш результатов подзадач в формате Parquet.
+
+    Ключом служит отпечаток подзадачи (см. telemars.utils.functools.task_fingerprint). Результаты хранятся в файлах
+    <path>/<ключ[:2]>/<ключ>.parquet.
+    Записи старше max_age не используются и удаляются. При превышении max_bytes удаляются записи, которые дольше
+    всего не запрашивались.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+        compression: str = 'zstd',
+    ) -> None:
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError('Максимальный размер кэша не может быть отрицательным.')
+
+        self.path: Path = Path(path)
+        self.max_bytes: Optional[int] = max_bytes
+        self.max_age: Optional[timedelta] = max_age
+        self.compression: str = compression
+
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / '{}.parquet'.format(key)
+
+    def _expired(self, stat: os.stat_result, now: float) -> bool:
+        return self.max_age is not None and now - stat.st_mtime > self.max_age.total_seconds()
+
+    def get(self, key: str) -> Optional[pl.DataFrame]:
+        """Возвращает результат из кэша или None, если записи нет или она устарела."""
+        file: Path = self._file(key)
+
+        try:
+            stat: os.stat_result = file.stat()
+        except FileNotFoundError:
+            return None
+
+        now: float = time.time()
+
+        if self._expired(stat, now):
+            file.unlink(missing_ok=True)
+            return None
+
+        try:
+            df: pl.DataFrame = pl.read_parquet(file)
+        except Exception as e:
+            # Поврежденная запись (например, после аварийного завершения) считается отсутствующей.
+            logger.warning('Не удалось прочитать запись кэша %s: %s', file, e)
+            file.unlink(missing_ok=True)
+            return None
+
+        # NOTE: Время доступа обновляется явно, так как файловая система может не обновлять atime.
+        os.utime(file, (now, stat.st_mtime))
+
+        return df
+
+    def put(self, key: str, df: pl.DataFrame) -> None:
+        """Сохраняет результат в кэш. Запись выполняется атомарно через временный файл."""
+        file: Path = self._file(key)
+        file.parent.mkdir(exist_ok=True)
+
+        tmp: Path = file.with_name('{}.{}.tmp'.format(file.name, os.getpid()))
+        df.write_parquet(tmp, compression=self.compression)
+        os.replace(tmp, file)
+
+        if self.max_bytes is not None:
+            self.evict()
+
+    def evict(self) -> None:
+        """Удаляет устаревшие записи и, при превышении max_bytes, записи, которые дольше всего не запрашивались."""
+        now: float = time.time()
+        entries: list[tuple[float, int, Path]] = []
+
+        for file in self.path.glob('*/*.parquet'):
+            try:
+                stat: os.stat_result = file.stat()
+            except FileNotFoundError:
+                continue
+
+            if self._expired(stat, now):
+                file.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_atime, stat.st_size, file))
+
+        if self.max_bytes is None:
+            return
+
+        total: int = sum(size for _, size, _ in entries)
+
+        for _, size, file in sorted(entries):
+            if total <= self.max_bytes:
+                break
+
+            file.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Удаляет все записи кэша."""
+        for file in self.path.glob('*/*.parquet'):
+            file.unlink(missing_ok=True)
@@ -48,3 +48,35 @@ class K7Statistic(Enum):
     UNIVERSE000_AVG = 'Universe000Avg'  # Зависит от ЦА.
     SAMPLE_AVG = 'SampleAvg'  # Зависит от ЦА.
     DURATION_AVG = 'DurationAvg'  # Не зависит от ЦА.
+
+    @property
+    def audience_dependent(self) -> bool:
+        """Зависит ли статистика от целевой аудитории (BaseDemoFilter).
+
+        Статистики, не зависящие от ЦА, достаточно рассчитать один раз для всех аудиторий.
+        """
+        return self not in AUDIENCE_INDEPENDENT
+
+
+# Статистики, не зависящие от целевой аудитории.
+AUDIENCE_INDEPENDENT: frozenset[K7Statistic] = frozenset(
+    {
+        K7Statistic.SALES_RTG000_SUM,
+        K7Statistic.SPOT_BY_BREAKS_SALES_RTG000_SUM,
+        K7Statistic.SALES_RTG_PER_SUM,
+        K7Statistic.STAND_SALES_RTG_PER_SUM,
+        K7Statistic.SPOT_BY_BREAKS_SALES_RTG_PER_SUM,
+        K7Statistic.SPOT_BY_BREAKS_STAND_SALES_RTG_PER_SUM,
+        K7Statistic.DURATION_SUM,
+        K7Statistic.QUANTITY_SUM,
+        K7Statistic.CONSOLIDATED_COST_SUM_RUB,
+        K7Statistic.CONSOLIDATED_COST_SUM_USD,
+        K7Statistic.SALES_RTG000_AVG,
+        K7Statistic.SPOT_BY_BREAKS_SALES_RTG000_AVG,
+        K7Statistic.SALES_RTG_PER_AVG,
+        K7Statistic.STAND_SALES_RTG_PER_AVG,
+        K7Statistic.SPOT_BY_BREAKS_SALES_RTG_PER_AVG,
+        K7Statistic.SPOT_BY_BREAKS_STAND_SALES_RTG_PER_AVG,
+        K7Statistic.DURATION_AVG,
+    }
+)
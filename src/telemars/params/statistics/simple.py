@@ -28,3 +28,28 @@ class K7Statistic(Enum):
     QUANTITY = 'Quantity'  # Не зависит от ЦА.
     CONSOLIDATED_COST_RUB = 'ConsolidatedCostRUB'  # Не зависит от ЦА.
     CONSOLIDATED_COST_USD = 'ConsolidatedCostUSD'  # Не зависит от ЦА.
+
+    @property
+    def audience_dependent(self) -> bool:
+        """Зависит ли статистика от целевой аудитории (BaseDemoFilter).
+
+        Статистики, не зависящие от ЦА, достаточно рассчитать один раз для всех аудиторий.
+        """
+        return self not in AUDIENCE_INDEPENDENT
+
+
+# Статистики, не зависящие от целевой аудитории.
+AUDIENCE_INDEPENDENT: frozenset[K7Statistic] = frozenset(
+    {
+        K7Statistic.SALES_RTG000,
+        K7Statistic.SPOT_BY_BREAKS_SALES_RTG000,
+        K7Statistic.SALES_RTG_PER,
+        K7Statistic.STAND_SALES_RTG_PER,
+        K7Statistic.SPOT_BY_BREAKS_SALES_RTG_PER,
+        K7Statistic.SPOT_BY_BREAKS_STAND_SALES_RTG_PER,
+        K7Statistic.DURATION,
+        K7Statistic.QUANTITY,
+        K7Statistic.CONSOLIDATED_COST_RUB,
+        K7Statistic.CONSOLIDATED_COST_USD,
+    }
+)
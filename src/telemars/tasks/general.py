@@ -0,0 +1,615 @@
+import asyncio
+import hashlib
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import partial
+
+import pandas as pd
+import polars as pl
+from mediascope_api.core import errors as mserr
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+from typing_extensions import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from telemars.api.client import TelemarsClient, get_default_client
+from telemars.api.decoder import decode_result
+from telemars.api.transport import PENDING_STATES, AsyncTransport
+from telemars.cache.journal import TaskJournal
+from telemars.cache.results import ResultCache
+from telemars.filters.general import BaseDemoFilter
+from telemars.utils.functools import task_fingerprint
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Максимальное количество одновременно отправляемых заданий по умолчанию.
+MAX_IN_FLIGHT: int = 8
+
+# Служебный столбец с ключом срезов при объединении результатов.
+MERGE_KEY: str = '__merge_key'
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+@dataclass
+class TaskInfo:
+    """Описание подзадачи: регион (город), аудитория и статистика."""
+
+    region_id: Optional[int]
+    basedemo_filter: BaseDemoFilter
+    statistic: Enum
+    # Время отправки задания в секундах. Заполняется после отправки.
+    submit_latency: Optional[float] = field(default=None, compare=False)
+    # Отпечаток задания (см. task_fingerprint). Одинаков для одинаковых подзадач в любом процессе.
+    fingerprint: Optional[str] = field(default=None, compare=False)
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    max_in_flight: int = MAX_IN_FLIGHT,
+) -> list[tuple[R, float]]:
+    """Выполняет корутину для каждого элемента конкурентно, ограничивая количество одновременных вызовов.
+
+    Args:
+        func (Callable[[T], Awaitable[R]]): Корутина, вызываемая для каждого элемента.
+        items (Sequence[T]): Элементы.
+        max_in_flight (int): Максимальное количество одновременных вызовов.
+
+    Returns:
+        list[tuple[R, float]]: Результаты и время выполнения (сек.) в порядке элементов.
+    """
+    if max_in_flight < 1:
+        raise ValueError('Количество одновременно отправляемых заданий должно быть не меньше 1.')
+
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def call(item: T) -> tuple[R, float]:
+        async with semaphore:
+            started: float = time.perf_counter()
+            result: R = await func(item)
+
+            return result, time.perf_counter() - started
+
+    return list(await asyncio.gather(*(call(item) for item in items)))
+
+
+async def submit_tasks(
+    payloads: Sequence[str],
+    send: Callable[[str], Awaitable[Optional[dict]]],
+    max_in_flight: int = MAX_IN_FLIGHT,
+) -> list[tuple[Optional[dict], float]]:
+    """Отправляет задания конкурентно, ограничивая количество одновременных запросов.
+
+    Args:
+        payloads (Sequence[str]): Задания в формате JSON.
+        send (Callable[[str], Awaitable[Optional[dict]]]): Корутина отправки одного задания.
+        max_in_flight (int): Максимальное количество одновременно отправляемых заданий.
+
+    Returns:
+        list[tuple[Optional[dict], float]]: Ответы сервера и время отправки (сек.) в порядке заданий.
+    """
+    return await gather_bounded(send, payloads, max_in_flight=max_in_flight)
+
+
+def frame_fingerprint(df: pl.DataFrame) -> str:
+    """Возвращает отпечаток DataFrame, не зависящий от порядка строк.
+
+    Отпечаток строится по именам и типам столбцов и отсортированным хэшам строк. Одинаковые по содержанию DataFrame
+    имеют одинаковый отпечаток, поэтому для поиска дубликатов достаточно одного прохода и словаря.
+    """
+    row_hashes: pl.Series = df.hash_rows(seed=0).sort()
+
+    schema: bytes = repr(list(df.schema.items())).encode('utf-8')
+
+    return hashlib.sha256(schema + row_hashes.to_numpy().tobytes()).hexdigest()
+
+
+def merge_frames(dfs: Sequence[pl.DataFrame], on: Sequence[str], how: Literal['left', 'full'] = 'left') -> pl.DataFrame:
+    """Объединяет DataFrame по ключевым столбцам в одном запросе.
+
+    Ключевые столбцы каждого DataFrame один раз хэшируются в один целочисленный ключ, после чего все DataFrame
+    присоединяются по нему в одном ленивом запросе. Строковые ключи не хэшируются повторно при каждом соединении.
+
+    Args:
+        dfs (Sequence[pl.DataFrame]): DataFrame с ключевыми столбцами и уникальными именами остальных столбцов.
+        on (Sequence[str]): Ключевые столбцы (срезы).
+        how (Literal['left', 'full']): left - только ключи первого DataFrame (аналог последовательных left join),
+            full - все ключи в порядке первого появления.
+
+    Returns:
+        pl.DataFrame: Ключевые столбцы и столбцы всех DataFrame в порядке их следования.
+    """
+    if how not in ('left', 'full'):
+        raise ValueError('Недопустимый способ объединения: {}.'.format(how))
+
+    if len(dfs) == 1:
+        return dfs[0]
+
+    # NOTE: Вероятность совпадения 64-битных хэшей разных срезов для отчетов в миллионы строк пренебрежимо мала.
+    keyed: list[pl.LazyFrame] = [df.lazy().with_columns(pl.struct(on).hash(seed=0).alias(MERGE_KEY)) for df in dfs]
+
+    if how == 'left':
+        merged: pl.LazyFrame = keyed[0]
+        others: list[pl.LazyFrame] = keyed[1:]
+    else:
+        merged = pl.concat([k.select(MERGE_KEY, *on) for k in keyed]).unique(subset=MERGE_KEY, maintain_order=True)
+        others = keyed
+
+    for other in others:
+        merged = merged.join(other.drop(on), on=MERGE_KEY, how='left', maintain_order='left')
+
+    return merged.drop(MERGE_KEY).collect()
+
+
+class BaseTask(BaseModel):
+    """Базовая задача расчета. Поля фильтров, срезов, статистик и опций задаются в наследниках."""
+
+    # Pydantic не может работать с кастомными типами по умолчанию.
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # Тип задания Mediascope API: simple, crosstab.
+    task_type: ClassVar[str]
+
+    # Сессия Mediascope API. Если не задана, компоненты mediascope-api-lib берутся из клиента по умолчанию.
+    client: Annotated[
+        Optional[TelemarsClient],
+        Field(default=None, exclude=True),
+    ]
+    # Асинхронный транспорт Mediascope API. Если не задан, используется транспорт клиента, а при его отсутствии
+    # транспорт создается на время выполнения execute().
+    transport: Annotated[
+        Optional[AsyncTransport],
+        Field(default=None, exclude=True),
+    ]
+
+    # Способ объединения результатов подзадач региона по срезам: left - только срезы первой подзадачи,
+    # full - все срезы, встречающиеся в результатах.
+    merge_how: Annotated[
+        Literal['left', 'full'],
+        Field(default='left'),
+    ]
+
+    # Кэш результатов подзадач. Если не задан, все подзадачи отправляются на расчет.
+    cache: Annotated[
+        Optional[ResultCache],
+        Field(default=None, exclude=True),
+    ]
+
+    # Журнал отправленных подзадач. Если задан, после перезапуска задача подключается к уже отправленным заданиям.
+    journal: Annotated[
+        Optional[TaskJournal],
+        Field(default=None, exclude=True),
+    ]
+
+    # Названия значений демографических срезов (см. _value_names).
+    _value_names_cache: Optional[dict[str, dict[str, str]]] = PrivateAttr(default=None)
+
+    @model_validator(mode='before')
+    @classmethod
+    def inject_client(cls, data: Any) -> Any:
+        """Заполняет незаданные компоненты mediascope-api-lib (mtask, mnet, cats) из клиента.
+
+        Компоненты создаются один раз на клиент, а не для каждой задачи.
+        """
+        if not isinstance(data, dict):
+            return data
+
+        missing: list[str] = [
+            name for name in ('mtask', 'mnet', 'cats') if name in cls.model_fields and name not in data
+        ]
+
+        if missing:
+            client: TelemarsClient = data.get('client') or get_default_client()
+            data = {**data, **{name: getattr(client, name) for name in missing}}
+
+        return data
+
+    def _build_task(self, basedemo_filter: BaseDemoFilter, statistic: Enum, region_id: Optional[int] = None) -> str:
+        """Генерирует задание в формате JSON для конкретной аудитории и статистики."""
+        # NOTE: Для каждого региона (города) необходимо переопределять фильтр.
+        company_filter_expr: str | None = self.company_filter.expr
+
+        if region_id is not None:
+            company_filter_copy: Any = self.company_filter.model_copy(deep=True)
+            company_filter_copy.region_id = [region_id]
+            company_filter_expr = company_filter_copy.expr
+
+        task: str = self.mtask.build_task(
+            task_type=self.task_type,
+            date_filter=self.date_filter.expr,
+            weekday_filter=self.weekday_filter.expr,
+            daytype_filter=self.daytype_filter.expr,
+            company_filter=company_filter_expr,
+            location_filter=self.location_filter.expr,
+            basedemo_filter=basedemo_filter.expr,
+            targetdemo_filter=self.targetdemo_filter.expr,
+            program_filter=self.program_filter.expr,
+            break_filter=self.break_filter.expr,
+            ad_filter=self.ad_filter.expr,
+            platform_filter=self.platform_filter.expr,
+            playbacktype_filter=self.playbacktype_filter.expr,
+            slices=[s.value for s in self.slices],
+            statistics=[statistic.value],
+            sortings={s[0].value: s[1].value for s in self.sortings} if self.sortings is not None else None,
+            options=self.options.expr,
+        )
+
+        return task
+
+    @asynccontextmanager
+    async def _open_transport(self) -> AsyncIterator[AsyncTransport]:
+        """Возвращает транспорт задачи или клиента, либо создает временный транспорт на основе настроек mnet."""
+        if self.transport is not None:
+            yield self.transport
+            return
+
+        if self.client is not None:
+            yield self.client.transport
+            return
+
+        async with AsyncTransport.from_network(self.mnet) as transport:
+            yield transport
+
+    async def _reattach(self, transport: AsyncTransport, fingerprints: Sequence[str]) -> dict[str, str]:
+        """Подключается к заданиям, отправленным ранее и записанным в журнал.
+
+        Задания, неизвестные серверу или завершившиеся с ошибкой, отправляются на расчет повторно.
+
+        Returns:
+            dict[str, str]: Идентификатор задания на сервере -> отпечаток подзадачи.
+        """
+        if self.journal is None:
+            return {}
+
+        journaled: dict[str, str] = {
+            task_id: fingerprint for fingerprint, task_id in self.journal.lookup(fingerprints).items()
+        }
+
+        if not journaled:
+            return {}
+
+        states: list[dict] = await transport.get_states(list(journaled))
+        alive: dict[str, str] = {
+            state['taskId']: journaled[state['taskId']]
+            for state in states
+            if state.get('taskId') in journaled
+            and (state.get('taskStatus') in PENDING_STATES or state.get('taskStatus') == 'DONE')
+        }
+
+        logger.info(
+            'Подключено %d из %d подзадач, записанных в журнал. Остальные будут отправлены повторно.',
+            len(alive),
+            len(journaled),
+        )
+
+        return alive
+
+    async def _send_task(self, transport: AsyncTransport, task_json: Optional[str]) -> Optional[dict]:
+        """Отправляет задание на расчет. Возвращает None, если задание не удалось сформировать или отправить."""
+        if task_json is None:
+            return None
+
+        try:
+            return await transport.submit(self.task_type, task_json)
+        except mserr.BadRequestError as e:
+            logger.error('Задание отклонено сервером: %s', e)
+            return None
+
+    def _region_ids(self) -> list[Optional[int]]:
+        """Возвращает список регионов для разбивки. Если регионы не заданы, возвращает [None]."""
+        if self.company_filter.region_id is not None:
+            return [r.value for r in self.company_filter.region_id]
+
+        # Если регионы не заданы, отправляем одну задачу без разбивки по регионам.
+        return [None]
+
+    def _plan(self) -> list[TaskInfo]:
+        """Формирует подзадачи для каждой комбинации: Регион (Город) -> Аудитория -> Статистика.
+
+        Статистики, не зависящие от аудитории (см. K7Statistic.audience_dependent), рассчитываются один раз на регион
+        с первой аудиторией.
+        """
+        plan: list[TaskInfo] = []
+
+        for region_id in self._region_ids():
+            for i, basedemo_filter in enumerate(self.basedemo_filter):
+                for statistic in self.statistics:
+                    if i > 0 and not statistic.audience_dependent:
+                        continue
+
+                    plan.append(TaskInfo(region_id=region_id, basedemo_filter=basedemo_filter, statistic=statistic))
+
+        return plan
+
+    def _value_names(self) -> dict[str, dict[str, str]]:
+        """Возвращает названия значений демографических срезов задачи: срез -> (идентификатор значения -> название)."""
+        slices: list[str] = [s.value for s in self.slices]
+        attribs: pd.DataFrame = self.mtask.cats.tv_demo_attribs
+        attribs = attribs[attribs['entityName'].isin(slices)]
+
+        value_names: dict[str, dict[str, str]] = {}
+
+        for entity, value_id, value_name in attribs[['entityName', 'valueId', 'valueName']].itertuples(index=False):
+            value_names.setdefault(entity, {})[str(value_id)] = value_name
+
+        return value_names
+
+    def _to_frame(self, task_info: TaskInfo, result: Union[bytes, dict]) -> pl.DataFrame:
+        """Преобразует результат подзадачи в pl.DataFrame со срезами и статистикой."""
+        # NOTE: Названия значений демографических срезов запрашиваются из справочника один раз на задачу.
+        if self._value_names_cache is None:
+            self._value_names_cache = self._value_names()
+
+        df: pl.DataFrame = decode_result(
+            result,
+            slices=[s.value for s in self.slices],
+            statistics=[task_info.statistic.value],
+            value_names=self._value_names_cache,
+        )
+
+        if df.is_empty():
+            return df
+
+        # Переименование столбца со статистикой, только если задана аудитория и статистика зависит от нее.
+        if task_info.basedemo_filter.name is not None and task_info.statistic.audience_dependent:
+            df = df.rename(
+                {task_info.statistic.value: '{} {}'.format(task_info.statistic.value, task_info.basedemo_filter.name)}
+            )
+
+        return df
+
+    def _merge_region(self, dfs: Sequence[pl.DataFrame]) -> pl.DataFrame:
+        """Объединяет результаты подзадач одного региона (города) по срезам."""
+        # NOTE: Важно пояснить. На этом этапе удаляем дубликаты DataFrame. Статистики, не зависящие от аудитории,
+        # рассчитываются один раз, но одинаковые результаты возможны и в остальных случаях (например, при повторяющихся
+        # аудиториях). Каждый DataFrame хэшируется один раз, дубликаты ищутся по отпечатку в словаре.
+        fingerprints: set[str] = set()
+        region_dfs: list[pl.DataFrame] = []
+
+        for df in dfs:
+            fingerprint: str = frame_fingerprint(df)
+
+            if fingerprint not in fingerprints:
+                fingerprints.add(fingerprint)
+                region_dfs.append(df)
+
+        slices: list[str] = [s.value for s in self.slices]
+        df: pl.DataFrame = merge_frames(region_dfs, slices, how=self.merge_how)
+
+        # Округление статистик с рейтингами (проценты) до 4 знаков.
+        return df.with_columns(pl.col(c).round(4) for c in df.columns if 'rtgper' in c.lower() and c not in slices)
+
+    # TODO: Добавить время жизни задачи и обработку ошибок по таймауту.
+    async def _iter_results(
+        self, max_in_flight: int = MAX_IN_FLIGHT, plan: Optional[Sequence[TaskInfo]] = None
+    ) -> AsyncIterator[tuple[TaskInfo, Optional[pl.DataFrame]]]:
+        """Отправляет задания для каждой комбинации города, аудитории и статистики и возвращает результаты подзадач
+        по мере их готовности. Для неотправленных и завершившихся ошибкой подзадач возвращается None.
+
+        Особенности расчета:
+        - Чтобы статистики рассчитывалась корректно, необходимо рассчитывать отдельно по каждому региону (городу).
+        - Каждая аудитория должна рассчитываться отдельной задачей.
+        - Каждая статистика должна рассчитываться отдельной задачей.
+        - Статистики, не зависящие от аудитории, рассчитываются один раз на регион.
+        - Задания отправляются конкурентно, одновременно не более max_in_flight заданий.
+        - Подзадачи возвращаются в порядке завершения расчета.
+
+        Args:
+            max_in_flight (int): Максимальное количество одновременно отправляемых заданий и загружаемых результатов.
+            plan (Optional[Sequence[TaskInfo]]): Подзадачи. По умолчанию формируются методом _plan().
+        """
+        # Отпечаток подзадачи -> (подзадачи, задание в формате JSON). Одинаковые задания отправляются один раз.
+        subtasks: dict[str, tuple[list[TaskInfo], str]] = {}
+
+        for info in self._plan() if plan is None else plan:
+            task_json: str = self._build_task(info.basedemo_filter, info.statistic, info.region_id)
+            info.fingerprint = task_fingerprint(task_json)
+            subtasks.setdefault(info.fingerprint, ([], task_json))[0].append(info)
+
+        # Результаты из кэша возвращаются сразу. На расчет отправляются только отсутствующие в кэше подзадачи.
+        if self.cache is not None:
+            hits: int = 0
+
+            for fingerprint in list(subtasks):
+                cached: Optional[pl.DataFrame] = self.cache.get(fingerprint)
+
+                if cached is not None:
+                    hits += 1
+
+                    for info in subtasks.pop(fingerprint)[0]:
+                        yield info, cached
+
+            logger.debug('Результаты %d из %d подзадач получены из кэша.', hits, hits + len(subtasks))
+
+        if not subtasks:
+            return
+
+        async with self._open_transport() as transport:
+            # Идентификатор задания на сервере -> отпечаток подзадачи.
+            submitted: dict[str, str] = await self._reattach(transport, list(subtasks))
+
+            fingerprints: list[str] = [f for f in subtasks if f not in submitted.values()]
+            responses: list[tuple[Optional[dict], float]] = await submit_tasks(
+                [subtasks[f][1] for f in fingerprints], partial(self._send_task, transport), max_in_flight=max_in_flight
+            )
+
+            for fingerprint, (response, latency) in zip(fingerprints, responses, strict=True):
+                infos: list[TaskInfo] = subtasks[fingerprint][0]
+
+                for info in infos:
+                    info.submit_latency = latency
+
+                logger.debug(
+                    'Подзадача %s (регион: %s, статистика: %s) отправлена за %.3f с.',
+                    fingerprint[:12],
+                    infos[0].region_id,
+                    infos[0].statistic.value,
+                    latency,
+                )
+
+                if response and response.get('taskId'):
+                    submitted[response['taskId']] = fingerprint
+                else:
+                    for info in infos:
+                        yield info, None
+
+            # NOTE: Задания записываются в журнал сразу после отправки, до ожидания расчета.
+            if self.journal is not None:
+                self.journal.record(
+                    (fingerprint, response['taskId'], 'IN_PROGRESS')
+                    for fingerprint, (response, _) in zip(fingerprints, responses, strict=True)
+                    if response and response.get('taskId')
+                )
+
+            # NOTE: Результаты загружаются в фоне по мере завершения расчета и передаются через очередь.
+            queue: asyncio.Queue[Optional[tuple[str, Optional[bytes]]]] = asyncio.Queue()
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(max_in_flight)
+
+            async def fetch(task_id: str) -> None:
+                async with semaphore:
+                    queue.put_nowait((task_id, await transport.get_result_raw(task_id)))
+
+            async def produce() -> None:
+                fetches: list[asyncio.Task] = []
+
+                try:
+                    # NOTE: Состояние всех заданий отчета опрашивается одним запросом.
+                    async for task_id, state in transport.iter_completed(list(submitted)):
+                        if self.journal is not None:
+                            self.journal.record([(submitted[task_id], task_id, state.get('taskStatus', ''))])
+
+                        # Задания, завершившиеся с ошибкой, не загружаются.
+                        if state.get('taskStatus') != 'DONE':
+                            logger.warning(
+                                'Подзадача %s (задание %s) завершилась со статусом %s: %s',
+                                submitted[task_id][:12],
+                                task_id,
+                                state.get('taskStatus'),
+                                state.get('message', ''),
+                            )
+                            queue.put_nowait((task_id, None))
+                            continue
+
+                        fetches.append(asyncio.create_task(fetch(task_id)))
+
+                    await asyncio.gather(*fetches)
+                finally:
+                    for f in fetches:
+                        f.cancel()
+
+                    queue.put_nowait(None)
+
+            producer: asyncio.Task = asyncio.create_task(produce())
+
+            try:
+                while (item := await queue.get()) is not None:
+                    task_id, result = item
+                    fingerprint = submitted[task_id]
+                    infos = subtasks[fingerprint][0]
+
+                    if result is None:
+                        for info in infos:
+                            yield info, None
+                        continue
+
+                    df: pl.DataFrame = self._to_frame(infos[0], result)
+
+                    if self.cache is not None:
+                        self.cache.put(fingerprint, df)
+
+                    for info in infos:
+                        yield info, df
+
+                # Поднимаем исключение фоновой загрузки, если оно было.
+                await producer
+            finally:
+                producer.cancel()
+
+    async def execute_stream(self, max_in_flight: int = MAX_IN_FLIGHT) -> AsyncIterator[tuple[TaskInfo, pl.DataFrame]]:
+        """Отправляет задания и возвращает результаты подзадач по мере их готовности.
+
+        Подзадачи возвращаются в порядке завершения расчета, пустые и завершившиеся ошибкой подзадачи пропускаются.
+        Результаты не объединяются: потребитель может сохранить каждую часть и освободить память.
+
+        Args:
+            max_in_flight (int): Максимальное количество одновременно отправляемых заданий и загружаемых результатов.
+
+        Yields:
+            tuple[TaskInfo, pl.DataFrame]: Описание подзадачи и ее результат.
+        """
+        async for task_info, df in self._iter_results(max_in_flight=max_in_flight):
+            if df is not None and not df.is_empty():
+                yield task_info, df
+
+    async def execute_stream_regions(
+        self, max_in_flight: int = MAX_IN_FLIGHT
+    ) -> AsyncIterator[tuple[Optional[int], pl.DataFrame]]:
+        """Отправляет задания и возвращает объединенные результаты по регионам (городам) по мере завершения всех
+        подзадач региона. Регионы без данных пропускаются.
+
+        Args:
+            max_in_flight (int): Максимальное количество одновременно отправляемых заданий и загружаемых результатов.
+
+        Yields:
+            tuple[Optional[int], pl.DataFrame]: Регион (город) и объединенный результат по нему.
+        """
+        plan: list[TaskInfo] = self._plan()
+
+        # Количество подзадач, результаты которых еще не получены, по регионам.
+        remaining: dict[Optional[int], int] = {}
+
+        for info in plan:
+            remaining[info.region_id] = remaining.get(info.region_id, 0) + 1
+
+        region_dfs: dict[Optional[int], list[tuple[int, pl.DataFrame]]] = {r: [] for r in remaining}
+
+        # NOTE: Подзадачи завершаются в произвольном порядке. Чтобы порядок столбцов не зависел от времени расчета,
+        # результаты региона объединяются в порядке подзадач плана.
+        order: dict[int, int] = {id(info): i for i, info in enumerate(plan)}
+
+        async for task_info, df in self._iter_results(max_in_flight=max_in_flight, plan=plan):
+            if df is not None and not df.is_empty():
+                region_dfs[task_info.region_id].append((order[id(task_info)], df))
+
+            remaining[task_info.region_id] -= 1
+
+            if remaining[task_info.region_id] == 0:
+                dfs: list[pl.DataFrame] = [
+                    df for _, df in sorted(region_dfs.pop(task_info.region_id), key=lambda x: x[0])
+                ]
+
+                if dfs:
+                    yield task_info.region_id, self._merge_region(dfs)
+
+    async def execute(self, max_in_flight: int = MAX_IN_FLIGHT) -> pl.DataFrame:
+        """Отправляет задания для каждой комбинации города, аудитории и статистики и возвращает результат.
+
+        Результаты регионов (городов) объединяются вертикально в порядке регионов в фильтре.
+
+        Args:
+            max_in_flight (int): Максимальное количество одновременно отправляемых заданий и загружаемых результатов.
+        """
+        rdfs: dict[Optional[int], pl.DataFrame] = {
+            region_id: df async for region_id, df in self.execute_stream_regions(max_in_flight=max_in_flight)
+        }
+
+        # NOTE: Окончательная проверка на пустой результат.
+        if not rdfs:
+            return pl.DataFrame()
+
+        return pl.concat([rdfs[region_id] for region_id in self._region_ids() if region_id in rdfs], how='vertical')
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from enum import Enum
 from typing import Any, Optional, Sequence, Union
 
@@ -32,3 +34,20 @@ def gen_flt_expr(filter_name: str, filter_values: Optional[Union[Sequence, Any]]
         return f'{filter_name} = {filter_values[0]}'
 
     return f'{filter_name} IN ({", ".join(map(str, filter_values))})'
+
+
+def task_fingerprint(task_json: str) -> str:
+    """Возвращает отпечаток задания: SHA-256 от канонического представления JSON.
+
+    В отличие от hash(), отпечаток не зависит от процесса, поэтому одинаковые подзадачи узнаются между запусками и
+    процессами. Порядок ключей и форматирование JSON на отпечаток не влияют.
+
+    Args:
+        task_json (str): Задание в формате JSON.
+
+    Returns:
+        str: Отпечаток в шестнадцатеричном виде.
+    """
+    canonical: str = json.dumps(json.loads(task_json), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
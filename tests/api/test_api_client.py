@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from telemars.api.client import TelemarsClient
+from telemars.api.transport import AsyncTransport
+from tests.conftest import MockServer
+
+
+def make_client(server: MockServer) -> TelemarsClient:
+    return TelemarsClient(
+        username='user',
+        passw='passw',
+        root_url=server.url,
+        client_id='client',
+        client_secret='secret',
+        keycloak_url=server.url + '/token',
+        status_delay=0,
+    )
+
+
+class TestTelemarsClient:
+    def test_client_mnet(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что сетевой модуль создается один раз."""
+        client: TelemarsClient = make_client(MOCK_SERVER)
+
+        assert client.mnet is client.mnet
+        assert client.mnet.root_url == MOCK_SERVER.url
+
+    @pytest.mark.asyncio
+    async def test_client_transport(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что транспорт и соединение переиспользуются в рамках цикла событий."""
+        async with make_client(MOCK_SERVER) as client:
+            transport: AsyncTransport = client.transport
+
+            await asyncio.gather(*(client.transport.submit('simple', '{}') for _ in range(5)))
+            await client.transport.submit('simple', '{}')
+
+            assert client.transport is transport
+
+        assert MOCK_SERVER.token_requests == 1
+
+    def test_client_transport_loops(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что для каждого цикла событий создается отдельный транспорт."""
+        client: TelemarsClient = make_client(MOCK_SERVER)
+
+        async def run() -> AsyncTransport:
+            async with client:
+                await client.transport.submit('simple', '{}')
+                return client.transport
+
+        first: AsyncTransport = asyncio.run(run())
+        second: AsyncTransport = asyncio.run(run())
+
+        assert first is not second
+        assert len(MOCK_SERVER.tasks) == 2
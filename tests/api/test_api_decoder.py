@@ -0,0 +1,113 @@
+import json
+from types import SimpleNamespace
+
+import pandas as pd
+import polars as pl
+import pytest
+from mediascope_api.mediavortex import tasks as cwt
+from polars.testing import assert_frame_equal
+
+from telemars.api.decoder import decode_result
+
+DEMO_ATTRIBS: pd.DataFrame = pd.DataFrame(
+    [
+        {'entityName': 'sex', 'valueId': 1, 'valueName': 'Мужчины'},
+        {'entityName': 'sex', 'valueId': 2, 'valueName': 'Женщины'},
+    ]
+)
+
+RESULT: dict = {
+    'taskId': '1',
+    'resultBody': [
+        {
+            'slice': {
+                'researchDate': '2025-05-12',
+                'researchWeekDay': 1,
+                'adSpotId': 6313910486,
+                'adStartTime': '253015',
+                'sex': 1,
+            },
+            'statistics': {'RtgPer': 0.3282, 'Quantity': 1},
+        },
+        {
+            'slice': {
+                'researchDate': '2025-05-13',
+                'researchWeekDay': 2,
+                'adSpotId': 6313910548,
+                'adStartTime': '123000',
+                'sex': 2,
+            },
+            'statistics': {'RtgPer': 1, 'Quantity': 2},
+        },
+        {
+            'slice': {
+                'researchDate': '2025-05-14',
+                'researchWeekDay': 3,
+                'adSpotId': 6313910583,
+                'adStartTime': '90000',
+            },
+            'statistics': {'Quantity': 3},
+        },
+    ],
+}
+
+
+def result2table(result: dict) -> pl.DataFrame:
+    """Преобразует результат средствами mediascope-api-lib (без создания сетевых компонентов)."""
+    mtask: cwt.MediaVortexTask = object.__new__(cwt.MediaVortexTask)
+    mtask.cats = SimpleNamespace(tv_demo_attribs=DEMO_ATTRIBS)
+
+    table: pd.DataFrame = mtask.result2table(result)
+
+    # NOTE: pl.from_pandas для столбцов object требует pyarrow. Пропуски (NaN) приводятся к null.
+    return pl.DataFrame(table.astype(object).where(table.notna(), None).to_dict('list'), strict=False)
+
+
+class TestDecodeResult:
+    @pytest.mark.parametrize('raw', [True, False])
+    @pytest.mark.parametrize(
+        'slices, statistics',
+        [
+            (['researchDate'], ['RtgPer']),
+            (['researchDate', 'adSpotId'], ['Quantity']),
+            (['researchDate', 'researchWeekDay', 'adStartTime'], ['RtgPer']),
+            (['researchDate', 'sex'], ['Quantity']),
+        ],
+    )
+    def test_decode_result(self, raw: bool, slices: list[str], statistics: list[str]) -> None:
+        """Тест проверяет, что результат совпадает с result2table из mediascope-api-lib."""
+        value_names: dict[str, dict[str, str]] = {'sex': {'1': 'Мужчины', '2': 'Женщины'}}
+        result: bytes | dict = json.dumps(RESULT).encode('utf-8') if raw else RESULT
+
+        expected: pl.DataFrame = result2table(RESULT).select(slices + statistics)
+        actual: pl.DataFrame = decode_result(result, slices, statistics, value_names=value_names)
+
+        assert_frame_equal(actual, expected, check_dtypes=False)
+
+    def test_decode_result_missing(self) -> None:
+        """Тест проверяет, что отсутствующие в строке срезы заполняются "-"."""
+        result: dict = {
+            'taskId': '1',
+            'resultBody': [
+                {'slice': {'researchDate': '2025-05-12', 'adStartTime': '90000'}, 'statistics': {'Quantity': 1}},
+                {'slice': {'researchDate': '2025-05-13'}, 'statistics': {'Quantity': 2}},
+            ],
+        }
+
+        df: pl.DataFrame = decode_result(result, ['researchDate', 'adStartTime', 'adSpotId'], ['Quantity'])
+
+        assert df['adStartTime'].to_list() == ['9:00:00', '-']
+        assert df['adSpotId'].to_list() == ['-', '-']
+
+    @pytest.mark.parametrize(
+        'result',
+        [
+            {'taskId': '1', 'resultBody': []},
+            {'taskId': '1'},
+            b'{"taskId": "1", "resultBody": []}',
+            b'{"taskId": "1"}',
+        ],
+    )
+    def test_decode_result_empty(self, result: bytes | dict) -> None:
+        """Тест проверяет, что для результата без строк возвращается пустой DataFrame."""
+        assert decode_result(result, ['researchDate'], ['RtgPer']).is_empty()
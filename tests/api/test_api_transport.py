@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+from mediascope_api.core import errors as mserr
+
+from tests.conftest import MockServer
+
+
+class TestAsyncTransport:
+    @pytest.mark.asyncio
+    async def test_submit_wait_result(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет полный цикл: отправка заданий, ожидание расчета одним опросом и получение результатов."""
+        async with MOCK_SERVER.transport() as transport:
+            payloads: list[str] = [json.dumps({'n': i}) for i in range(10)]
+            responses: list[dict] = await asyncio.gather(*(transport.submit('simple', p) for p in payloads))
+            task_ids: list[str] = [r['taskId'] for r in responses]
+
+            states: dict[str, dict] = await transport.wait_tasks(task_ids)
+            results: list[dict] = await asyncio.gather(*(transport.get_result(tid) for tid in task_ids))
+
+        assert all(states[tid]['taskStatus'] == 'DONE' for tid in task_ids)
+        assert [r['resultBody'][0]['n'] for r in results] == list(range(10))
+        assert MOCK_SERVER.state_requests == 1
+        assert MOCK_SERVER.token_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_keep_alive(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что последовательные запросы используют одно соединение."""
+        async with MOCK_SERVER.transport() as transport:
+            for i in range(5):
+                response: dict = await transport.submit('simple', json.dumps({'n': i}))
+                await transport.get_state(response['taskId'])
+
+        assert MOCK_SERVER.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_server_error(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет повтор запроса при ответе 503."""
+        MOCK_SERVER.fail_submits = 2
+
+        async with MOCK_SERVER.transport(backoff_factor=0) as transport:
+            response: dict = await transport.submit('simple', json.dumps({'n': 1}))
+
+        assert response['taskId'] == '1'
+
+    @pytest.mark.asyncio
+    async def test_retry_exhausted(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что после исчерпания повторов поднимается ServerError."""
+        MOCK_SERVER.fail_submits = 10
+
+        async with MOCK_SERVER.transport(retries=2, backoff_factor=0) as transport:
+            with pytest.raises(mserr.ServerError):
+                await transport.submit('simple', json.dumps({'n': 1}))
+
+    @pytest.mark.asyncio
+    async def test_bad_request(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что ответ 400 преобразуется в BadRequestError."""
+        async with MOCK_SERVER.transport() as transport:
+            with pytest.raises(mserr.BadRequestError):
+                await transport.submit('simple', json.dumps({'invalid': True}))
+
+    @pytest.mark.asyncio
+    async def test_token_refresh(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что при отзыве токена сервером запрашивается новый токен."""
+        MOCK_SERVER.reject_tokens = 1
+
+        async with MOCK_SERVER.transport() as transport:
+            await transport.submit('simple', json.dumps({'n': 1}))
+            await transport.submit('simple', json.dumps({'n': 2}))
+
+        assert MOCK_SERVER.token_requests == 2
@@ -0,0 +1,70 @@
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from telemars.cache.availability import AvailabilityCache
+
+
+class FakeCats:
+    """Справочники Mediascope, подсчитывающие количество запросов доступных периодов."""
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+
+    def get_availability_period(self) -> pd.DataFrame:
+        self.requests += 1
+
+        return pd.DataFrame(
+            [
+                {'id': '4', 'name': 'TV Index All Russia', 'periodFrom': '2020-01-01', 'periodTo': '2025-06-30'},
+                {'id': '7', 'name': 'Big TV', 'periodFrom': '2024-01-01', 'periodTo': '2025-06-15'},
+            ]
+        )
+
+
+class TestAvailabilityCache:
+    @pytest.mark.parametrize(
+        'kit_id, expected',
+        [
+            (7, (date(2024, 1, 1), date(2025, 6, 15))),
+            (4, (date(2020, 1, 1), date(2025, 6, 30))),
+            (1, None),
+        ],
+    )
+    def test_availability_get(self, kit_id: int, expected: tuple[date, date] | None) -> None:
+        """Тест проверяет получение доступного периода по KitID."""
+        assert AvailabilityCache().get(FakeCats(), kit_id) == expected
+
+    def test_availability_shared(self) -> None:
+        """Тест проверяет, что справочник запрашивается один раз за время жизни кэша."""
+        cache: AvailabilityCache = AvailabilityCache()
+        cats: FakeCats = FakeCats()
+
+        for _ in range(100):
+            cache.get(cats, 7)
+
+        assert cats.requests == 1
+
+    def test_availability_ttl(self) -> None:
+        """Тест проверяет, что по истечении времени жизни справочник запрашивается повторно."""
+        cache: AvailabilityCache = AvailabilityCache(ttl=timedelta(seconds=0.05))
+        cats: FakeCats = FakeCats()
+
+        cache.get(cats, 7)
+        time.sleep(0.1)
+        cache.get(cats, 7)
+
+        assert cats.requests == 2
+
+    def test_availability_disk(self, tmp_path: Path) -> None:
+        """Тест проверяет, что периоды из файла используются новым экземпляром кэша."""
+        path: Path = tmp_path / 'availability.json'
+        cats: FakeCats = FakeCats()
+
+        AvailabilityCache(path=path).get(cats, 7)
+
+        assert AvailabilityCache(path=path).get(cats, 7) == (date(2024, 1, 1), date(2025, 6, 15))
+        assert cats.requests == 1
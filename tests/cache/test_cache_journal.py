@@ -0,0 +1,41 @@
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from telemars.cache.journal import TaskJournal
+
+
+class TestTaskJournal:
+    def test_journal_roundtrip(self, tmp_path: Path) -> None:
+        """Тест проверяет запись и чтение подзадач, в том числе после повторного открытия журнала."""
+        journal: TaskJournal = TaskJournal(tmp_path / 'journal.db')
+        journal.record([('a', '1', 'IN_PROGRESS'), ('b', '2', 'IN_PROGRESS')])
+        journal.record([('a', '1', 'DONE')])
+        journal.close()
+
+        journal = TaskJournal(tmp_path / 'journal.db')
+
+        assert journal.lookup(['a', 'b', 'c']) == {'a': '1', 'b': '2'}
+        assert journal.status('a') == 'DONE'
+        assert journal.status('c') is None
+
+        journal.clear()
+
+        assert journal.lookup(['a', 'b']) == {}
+
+    def test_journal_max_age(self, tmp_path: Path) -> None:
+        """Тест проверяет, что устаревшие записи не используются."""
+        journal: TaskJournal = TaskJournal(tmp_path / 'journal.db', max_age=timedelta(hours=1))
+        journal.record([('a', '1', 'IN_PROGRESS')])
+
+        with journal._conn:
+            journal._conn.execute('UPDATE tasks SET updated_at = ?', (time.time() - 7200,))
+
+        assert journal.lookup(['a']) == {}
+
+    def test_journal_many(self, tmp_path: Path) -> None:
+        """Тест проверяет поиск по количеству отпечатков, превышающему лимит параметров SQLite."""
+        journal: TaskJournal = TaskJournal(tmp_path / 'journal.db')
+        journal.record((str(i), str(i), 'DONE') for i in range(2000))
+
+        assert len(journal.lookup([str(i) for i in range(2500)])) == 2000
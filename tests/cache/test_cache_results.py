@@ -0,0 +1,70 @@
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from telemars.cache.results import ResultCache
+from telemars.utils.functools import task_fingerprint
+
+
+class TestResultCache:
+    @pytest.mark.parametrize(
+        'df',
+        [
+            pl.DataFrame({'researchDate': ['2025-05-12'], 'RtgPer All 25-50': [0.3282]}),
+            pl.DataFrame(),
+        ],
+    )
+    def test_cache_roundtrip(self, tmp_path: Path, df: pl.DataFrame) -> None:
+        """Тест проверяет сохранение и чтение результата, в том числе пустого."""
+        cache: ResultCache = ResultCache(tmp_path)
+        key: str = task_fingerprint('{"a": 1}')
+
+        assert cache.get(key) is None
+
+        cache.put(key, df)
+
+        assert_frame_equal(cache.get(key), df)
+
+    def test_cache_max_age(self, tmp_path: Path) -> None:
+        """Тест проверяет, что устаревшие записи не возвращаются и удаляются."""
+        cache: ResultCache = ResultCache(tmp_path, max_age=timedelta(hours=1))
+        key: str = task_fingerprint('{"a": 1}')
+        cache.put(key, pl.DataFrame({'a': [1]}))
+
+        file: Path = next(tmp_path.glob('*/*.parquet'))
+        old: float = time.time() - 7200
+        os.utime(file, (old, old))
+
+        assert cache.get(key) is None
+        assert not file.exists()
+
+    def test_cache_max_bytes(self, tmp_path: Path) -> None:
+        """Тест проверяет, что при превышении размера удаляются записи, которые дольше всего не запрашивались."""
+        cache: ResultCache = ResultCache(tmp_path)
+        keys: list[str] = [task_fingerprint('{{"a": {}}}'.format(i)) for i in range(3)]
+
+        for i, key in enumerate(keys):
+            cache.put(key, pl.DataFrame({'a': [i]}))
+            file: Path = next(tmp_path.glob('*/{}.parquet'.format(key)))
+            os.utime(file, (time.time() - 100 + i, time.time()))
+
+        # Запрос первой записи делает ее самой свежей.
+        cache.get(keys[0])
+
+        size: int = sum(f.stat().st_size for f in tmp_path.glob('*/*.parquet'))
+        cache.max_bytes = size - 1
+        cache.evict()
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+
+    def test_cache_incorrect(self, tmp_path: Path) -> None:
+        """Тест проверяет, что при отрицательном размере кэша поднимается исключение."""
+        with pytest.raises(ValueError):
+            ResultCache(tmp_path, max_bytes=-1)
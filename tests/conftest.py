@@ -0,0 +1,148 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from typing_extensions import Any, Iterator
+
+from telemars.api.transport import AsyncTransport
+
+
+class MockServer(ThreadingHTTPServer):
+    """Локальная заглушка Mediascope API и Keycloak.
+
+    По умолчанию задания рассчитываются мгновенно: итоговое состояние возвращается при первом опросе. Поле polls
+    задания задает количество опросов, в течение которых задание остается в состоянии IN_PROGRESS, поле status -
+    итоговое состояние.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), MockHandler)
+        self.lock: threading.Lock = threading.Lock()
+        self.connections: int = 0
+        self.token_requests: int = 0
+        self.state_requests: int = 0
+        self.tasks: dict[str, dict] = {}
+        # Количество ответов 503, которые вернет сервер перед успешным ответом на отправку задания.
+        self.fail_submits: int = 0
+        # Количество ответов 401 перед успешным ответом (токен отозван сервером).
+        self.reject_tokens: int = 0
+
+    @property
+    def url(self) -> str:
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+    def transport(self, **kwargs: Any) -> AsyncTransport:
+        """Возвращает транспорт, подключенный к заглушке. Статус заданий опрашивается без задержки."""
+        kwargs.setdefault('status_delay', 0)
+
+        return AsyncTransport(
+            root_url=self.url,
+            keycloak_url=self.url + '/token',
+            username='user',
+            passw='passw',
+            client_id='client',
+            client_secret='secret',
+            **kwargs,
+        )
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: MockServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: Any) -> None:
+        content: bytes = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _read(self) -> bytes:
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def _poll(self, task_id: str) -> dict:
+        task: dict = self.server.tasks[task_id]
+
+        if task['polls'] > 0:
+            task['polls'] -= 1
+        else:
+            task['taskStatus'] = task['payload'].get('status', 'DONE')
+
+        return {'taskId': task_id, 'taskStatus': task['taskStatus']}
+
+    def do_POST(self) -> None:
+        body: bytes = self._read()
+
+        with self.server.lock:
+            if self.path == '/token':
+                self.server.token_requests += 1
+                return self._send(200, {'access_token': 'token', 'expires_in': 3600})
+
+            if self.server.reject_tokens > 0:
+                self.server.reject_tokens -= 1
+                return self._send(401, {'error': 'invalid token'})
+
+            if self.path == '/task/state':
+                self.server.state_requests += 1
+                ids: list[str] = json.loads(body)['taskIds']
+                return self._send(200, {'data': [self._poll(i) for i in ids if i in self.server.tasks]})
+
+            if self.path.startswith('/task/'):
+                if self.server.fail_submits > 0:
+                    self.server.fail_submits -= 1
+                    return self._send(503, {'error': 'unavailable'})
+
+                task: dict = json.loads(body)
+
+                if task.get('invalid'):
+                    return self._send(400, {'error': 'bad request'})
+
+                task_id: str = str(len(self.server.tasks) + 1)
+                self.server.tasks[task_id] = {
+                    'taskId': task_id,
+                    'taskStatus': 'IN_PROGRESS',
+                    'polls': task.get('polls', 0),
+                    'payload': task,
+                }
+
+                return self._send(200, {'taskId': task_id})
+
+        self._send(404, {'error': 'not found'})
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            if self.path.startswith('/task/state/'):
+                task_id: str = self.path.rsplit('/', 1)[1]
+                return self._send(200, self._poll(task_id))
+
+            if self.path.startswith('/task/result/'):
+                task_id = self.path.rsplit('/', 1)[1]
+                task: dict = self.server.tasks[task_id]
+                return self._send(200, {'taskId': task_id, 'resultBody': [task['payload']]})
+
+        self._send(404, {'error': 'not found'})
+
+
+@pytest.fixture(name='MOCK_SERVER')
+def mock_server() -> Iterator[MockServer]:
+    """Запускает локальную заглушку Mediascope API в отдельном потоке."""
+    server: MockServer = MockServer()
+    thread: threading.Thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
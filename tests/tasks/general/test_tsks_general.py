@@ -0,0 +1,347 @@
+import asyncio
+import json
+from enum import Enum
+from pathlib import Path
+from typing import Any, ClassVar, Optional
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from telemars.api.client import TelemarsClient
+from telemars.cache.journal import TaskJournal
+from telemars.cache.results import ResultCache
+from telemars.filters import general as gflt
+from telemars.params.filters.general import RegionId
+from telemars.params.slices.simple import Slice
+from telemars.params.statistics.simple import K7Statistic
+from telemars.tasks.general import BaseTask, TaskInfo, frame_fingerprint, merge_frames, submit_tasks
+from tests.conftest import MockServer
+
+
+class TestSubmitTasks:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('max_in_flight', [1, 3, 8])
+    async def test_submit_tasks_bounded(self, max_in_flight: int) -> None:
+        """Тест проверяет, что одновременно отправляется не более max_in_flight заданий, а порядок сохраняется."""
+        in_flight: int = 0
+        peak: int = 0
+
+        async def send(payload: str) -> Optional[dict]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {'taskId': payload}
+
+        payloads: list[str] = [str(i) for i in range(20)]
+        responses: list[tuple[Optional[dict], float]] = await submit_tasks(payloads, send, max_in_flight=max_in_flight)
+
+        assert peak == max_in_flight
+        assert [r[0]['taskId'] for r in responses] == payloads
+        assert all(latency > 0 for _, latency in responses)
+
+    @pytest.mark.asyncio
+    async def test_submit_tasks_incorrect(self) -> None:
+        """Тест проверяет, что при недопустимом ограничении конкурентности поднимается исключение."""
+
+        async def send(payload: str) -> Optional[dict]:
+            return None
+
+        with pytest.raises(ValueError):
+            await submit_tasks(['{}'], send, max_in_flight=0)
+
+
+class TestFrameFingerprint:
+    def test_fingerprint_row_order(self) -> None:
+        """Тест проверяет, что отпечаток не зависит от порядка строк."""
+        df: pl.DataFrame = pl.DataFrame({'researchDate': ['2025-05-12', '2025-05-13'], 'Quantity': [1, 2]})
+
+        assert frame_fingerprint(df) == frame_fingerprint(df.reverse())
+
+    @pytest.mark.parametrize(
+        'other',
+        [
+            pl.DataFrame({'researchDate': ['2025-05-12', '2025-05-13'], 'Quantity': [1, 3]}),
+            pl.DataFrame({'researchDate': ['2025-05-12', '2025-05-13'], 'Duration': [1, 2]}),
+            pl.DataFrame({'researchDate': ['2025-05-12', '2025-05-13'], 'Quantity': [1.0, 2.0]}),
+            pl.DataFrame({'researchDate': ['2025-05-12'], 'Quantity': [1]}),
+        ],
+    )
+    def test_fingerprint_different(self, other: pl.DataFrame) -> None:
+        """Тест проверяет, что DataFrame с разными значениями, столбцами или типами имеют разные отпечатки."""
+        df: pl.DataFrame = pl.DataFrame({'researchDate': ['2025-05-12', '2025-05-13'], 'Quantity': [1, 2]})
+
+        assert frame_fingerprint(df) != frame_fingerprint(other)
+
+
+class TestMergeFrames:
+    DFS: list[pl.DataFrame] = [
+        pl.DataFrame({'researchDate': ['2025-05-12', '2025-05-13'], 'RtgPer All 18+': [0.1, 0.2]}),
+        pl.DataFrame({'researchDate': ['2025-05-13', '2025-05-14'], 'RtgPer All 25-50': [0.3, 0.4]}),
+        pl.DataFrame({'researchDate': ['2025-05-12', '2025-05-14'], 'Quantity': [1, 2]}),
+    ]
+
+    def test_merge_left(self) -> None:
+        """Тест проверяет, что объединение left совпадает с последовательными left join."""
+        expected: pl.DataFrame = self.DFS[0]
+
+        for df in self.DFS[1:]:
+            expected = expected.join(df, on='researchDate', how='left')
+
+        assert_frame_equal(merge_frames(self.DFS, ['researchDate'], how='left'), expected)
+
+    def test_merge_full(self) -> None:
+        """Тест проверяет, что объединение full сохраняет срезы, отсутствующие в первом DataFrame."""
+        expected: pl.DataFrame = pl.DataFrame(
+            {
+                'researchDate': ['2025-05-12', '2025-05-13', '2025-05-14'],
+                'RtgPer All 18+': [0.1, 0.2, None],
+                'RtgPer All 25-50': [None, 0.3, 0.4],
+                'Quantity': [1, None, 2],
+            }
+        )
+
+        assert_frame_equal(merge_frames(self.DFS, ['researchDate'], how='full'), expected)
+
+    def test_merge_incorrect(self) -> None:
+        """Тест проверяет, что при недопустимом способе объединения поднимается исключение."""
+        with pytest.raises(ValueError):
+            merge_frames(self.DFS, ['researchDate'], how='inner')
+
+
+class StubTask(BaseTask):
+    """Задача, формирующая задания без mediascope-api-lib. Результат задания - строки из поля rows."""
+
+    task_type: ClassVar[str] = 'simple'
+
+    company_filter: gflt.CompanyFilter = gflt.CompanyFilter()
+    basedemo_filter: list[gflt.BaseDemoFilter]
+    slices: list[Slice] = [Slice.RESEARCH_DATE]
+    statistics: list[K7Statistic]
+    # Регион -> количество опросов статуса до завершения расчета.
+    polls: dict[Optional[int], int] = {}
+
+    def _build_task(
+        self, basedemo_filter: gflt.BaseDemoFilter, statistic: Enum, region_id: Optional[int] = None
+    ) -> str:
+        value: float = float(region_id or 0) + (basedemo_filter.age[0] if statistic.audience_dependent else 0.5)
+
+        return json.dumps({'polls': self.polls.get(region_id, 0), 'researchDate': '2025-05-12', 'value': value})
+
+    def _to_frame(self, task_info: TaskInfo, result: bytes) -> pl.DataFrame:
+        row: dict = json.loads(result)['resultBody'][0]
+        df: pl.DataFrame = pl.DataFrame(
+            [{'researchDate': row['researchDate'], task_info.statistic.value: row['value']}]
+        )
+
+        if task_info.statistic.audience_dependent:
+            df = df.rename(
+                {task_info.statistic.value: '{} {}'.format(task_info.statistic.value, task_info.basedemo_filter.name)}
+            )
+
+        return df
+
+
+class TestPlan:
+    @pytest.mark.parametrize(
+        'audiences, statistics, expected',
+        [
+            (1, [K7Statistic.RTG_PER], 1),
+            (10, [K7Statistic.RTG_PER], 10),
+            (10, [K7Statistic.QUANTITY], 1),
+            (
+                10,
+                [
+                    K7Statistic.QUANTITY,
+                    K7Statistic.DURATION,
+                    K7Statistic.SALES_RTG_PER,
+                    K7Statistic.CONSOLIDATED_COST_RUB,
+                    K7Statistic.RTG_PER,
+                ],
+                10 + 4,
+            ),
+        ],
+    )
+    def test_plan_audience_independent(self, audiences: int, statistics: list[K7Statistic], expected: int) -> None:
+        """Тест проверяет, что статистики, не зависящие от аудитории, рассчитываются один раз на регион."""
+        task: StubTask = StubTask(
+            company_filter=gflt.CompanyFilter(region_id=[RegionId.NETWORK_BROADCASTING, RegionId.INTERNET]),
+            basedemo_filter=[gflt.BaseDemoFilter(age=(18 + i, 99)) for i in range(audiences)],
+            statistics=statistics,
+        )
+
+        assert len(task._plan()) == 2 * expected
+
+
+class TestExecuteStream:
+    @pytest.mark.asyncio
+    async def test_execute_stream_completion_order(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что подзадачи возвращаются в порядке завершения расчета, а не в порядке отправки."""
+        async with MOCK_SERVER.transport() as transport:
+            task: StubTask = StubTask(
+                transport=transport,
+                company_filter=gflt.CompanyFilter(region_id=[RegionId.NETWORK_BROADCASTING, RegionId.INTERNET]),
+                basedemo_filter=[gflt.BaseDemoFilter(age=(25, 50))],
+                statistics=[K7Statistic.RTG_PER],
+                polls={RegionId.NETWORK_BROADCASTING.value: 3},
+            )
+
+            regions: list[Optional[int]] = [info.region_id async for info, _ in task.execute_stream()]
+
+        assert regions == [RegionId.INTERNET.value, RegionId.NETWORK_BROADCASTING.value]
+
+    @pytest.mark.asyncio
+    async def test_execute_stream_regions(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет объединение подзадач по регионам и удаление дубликатов общих статистик."""
+        async with MOCK_SERVER.transport() as transport:
+            task: StubTask = StubTask(
+                transport=transport,
+                company_filter=gflt.CompanyFilter(region_id=[RegionId.NETWORK_BROADCASTING, RegionId.INTERNET]),
+                basedemo_filter=[gflt.BaseDemoFilter(age=(25, 50)), gflt.BaseDemoFilter(age=(18, 99))],
+                statistics=[K7Statistic.RTG_PER, K7Statistic.QUANTITY],
+                polls={RegionId.NETWORK_BROADCASTING.value: 2},
+            )
+
+            regions: list[tuple[Optional[int], pl.DataFrame]] = [r async for r in task.execute_stream_regions()]
+            result: pl.DataFrame = await task.execute()
+
+        assert [region_id for region_id, _ in regions] == [RegionId.INTERNET.value, RegionId.NETWORK_BROADCASTING.value]
+        assert sorted(regions[0][1].columns) == sorted(
+            ['researchDate', 'RtgPer All 25-50', 'RtgPer All 18+', 'Quantity']
+        )
+        assert result['RtgPer All 25-50'].to_list() == [124.0, 125.0]
+        assert result['Quantity'].to_list() == [99.5, 100.5]
+        # Quantity не зависит от аудитории и рассчитывается один раз на регион: 2 запуска × 2 региона × 3 подзадачи.
+        assert len(MOCK_SERVER.tasks) == 2 * 2 * 3
+
+    @pytest.mark.asyncio
+    async def test_execute_stream_failed(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что подзадачи, завершившиеся ошибкой, пропускаются."""
+
+        class FailedTask(StubTask):
+            def _build_task(
+                self, basedemo_filter: gflt.BaseDemoFilter, statistic: Enum, region_id: Optional[int] = None
+            ) -> str:
+                return json.dumps({'status': 'FAILED'})
+
+        async with MOCK_SERVER.transport() as transport:
+            task: FailedTask = FailedTask(
+                transport=transport,
+                basedemo_filter=[gflt.BaseDemoFilter(age=(25, 50))],
+                statistics=[K7Statistic.RTG_PER],
+            )
+
+            assert [r async for r in task.execute_stream()] == []
+            assert (await task.execute()).is_empty()
+
+    @pytest.mark.asyncio
+    async def test_execute_stream_duplicates(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что одинаковые подзадачи отправляются один раз и получают общий отпечаток."""
+        async with MOCK_SERVER.transport() as transport:
+            task: StubTask = StubTask(
+                transport=transport,
+                basedemo_filter=[gflt.BaseDemoFilter(age=(25, 50)), gflt.BaseDemoFilter(age=(25, 50))],
+                statistics=[K7Statistic.RTG_PER],
+            )
+
+            infos: list[TaskInfo] = [info async for info, _ in task.execute_stream()]
+
+        assert len(infos) == 2
+        assert infos[0].fingerprint is not None and infos[0].fingerprint == infos[1].fingerprint
+        assert len(MOCK_SERVER.tasks) == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_cache(self, MOCK_SERVER: MockServer, tmp_path: Path) -> None:
+        """Тест проверяет, что на расчет отправляются только подзадачи, отсутствующие в кэше."""
+        cache: ResultCache = ResultCache(tmp_path)
+
+        async with MOCK_SERVER.transport() as transport:
+            task: StubTask = StubTask(
+                transport=transport,
+                cache=cache,
+                basedemo_filter=[gflt.BaseDemoFilter(age=(25, 50))],
+                statistics=[K7Statistic.RTG_PER],
+            )
+            first: pl.DataFrame = await task.execute()
+
+            task = StubTask(
+                transport=transport,
+                cache=cache,
+                basedemo_filter=[gflt.BaseDemoFilter(age=(25, 50)), gflt.BaseDemoFilter(age=(18, 99))],
+                statistics=[K7Statistic.RTG_PER],
+            )
+            second: pl.DataFrame = await task.execute()
+
+        assert len(MOCK_SERVER.tasks) == 2
+        assert_frame_equal(second.select(first.columns), first)
+
+    @pytest.mark.asyncio
+    async def test_execute_journal_resume(self, MOCK_SERVER: MockServer, tmp_path: Path) -> None:
+        """Тест проверяет, что после прерывания задача подключается к отправленным заданиям, а не отправляет их снова."""
+        journal: TaskJournal = TaskJournal(tmp_path / 'journal.db')
+
+        def make_task(transport: Any) -> StubTask:
+            return StubTask(
+                transport=transport,
+                journal=journal,
+                company_filter=gflt.CompanyFilter(region_id=[RegionId.NETWORK_BROADCASTING, RegionId.INTERNET]),
+                basedemo_filter=[gflt.BaseDemoFilter(age=(25, 50))],
+                statistics=[K7Statistic.RTG_PER],
+                polls={RegionId.NETWORK_BROADCASTING.value: 10**9, RegionId.INTERNET.value: 10**9},
+            )
+
+        async with MOCK_SERVER.transport() as transport:
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(make_task(transport).execute(), timeout=0.2)
+
+        assert len(MOCK_SERVER.tasks) == 2
+
+        # Сервер завершает расчет, пока процесс перезапускается. Одно из заданий сервер "забыл".
+        for task in MOCK_SERVER.tasks.values():
+            task['polls'] = 0
+
+        del MOCK_SERVER.tasks['2']
+
+        async with MOCK_SERVER.transport() as transport:
+            result: pl.DataFrame = await make_task(transport).execute()
+
+        assert sorted(result['RtgPer All 25-50'].to_list()) == [124.0, 125.0]
+        # Повторно отправлено только задание, неизвестное серверу.
+        assert sorted(MOCK_SERVER.tasks) == ['1', '2']
+        assert {journal.status(info.fingerprint) for info in make_task(None)._plan() if info.fingerprint} <= {'DONE'}
+
+    @pytest.mark.asyncio
+    async def test_execute_client(self, MOCK_SERVER: MockServer) -> None:
+        """Тест проверяет, что задачи используют компоненты и соединения общего клиента."""
+
+        class ClientTask(StubTask):
+            mnet: Any
+
+        client: TelemarsClient = TelemarsClient(
+            username='user',
+            passw='passw',
+            root_url=MOCK_SERVER.url,
+            client_id='client',
+            client_secret='secret',
+            keycloak_url=MOCK_SERVER.url + '/token',
+            status_delay=0,
+        )
+
+        async with client:
+            tasks: list[ClientTask] = [
+                ClientTask(
+                    client=client,
+                    basedemo_filter=[gflt.BaseDemoFilter(age=(25, 50))],
+                    statistics=[K7Statistic.RTG_PER],
+                )
+                for _ in range(3)
+            ]
+
+            for task in tasks:
+                await task.execute()
+
+        assert all(task.mnet is client.mnet for task in tasks)
+        assert MOCK_SERVER.connections == 1
+        assert MOCK_SERVER.token_requests == 1
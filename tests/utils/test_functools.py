@@ -0,0 +1,15 @@
+from telemars.utils.functools import task_fingerprint
+
+
+class TestTaskFingerprint:
+    def test_task_fingerprint_canonical(self) -> None:
+        """Тест проверяет, что порядок ключей и форматирование JSON не влияют на отпечаток."""
+        assert task_fingerprint('{"a": 1, "b": [1, 2]}') == task_fingerprint('{"b":[1,2],"a":1}')
+
+    def test_task_fingerprint_different(self) -> None:
+        """Тест проверяет, что разные задания имеют разные отпечатки."""
+        assert task_fingerprint('{"a": 1}') != task_fingerprint('{"a": 2}')
+
+    def test_task_fingerprint_stable(self) -> None:
+        """Тест проверяет, что отпечаток не зависит от процесса (в отличие от hash())."""
+        assert task_fingerprint('{"a": 1}') == '015abd7f5cc57a2dd94b7590f04ad8084273905ee33ec5cebeae62276a97f862'